@@ -16,6 +16,22 @@ const ACTION_LABELS = ["move_x", "move_y", "move_random", "move_forward", "turn_
 const DIRS = [[1, 0], [1, 1], [0, 1], [-1, 1], [-1, 0], [-1, -1], [0, -1], [1, -1]];
 const formatVal = (n) => typeof n === 'number' ? n.toFixed(2) : n;
 
+// Server snapshots are columnar: base64 of little-endian uint16 xs / ys,
+// uint8 headings and packed uint8 r,g,b triples
+const b64Bytes = (s) => Uint8Array.from(atob(s), ch => ch.charCodeAt(0));
+const decodeSnapshot = (snap) => {
+  if (!snap || !snap.n) return [];
+  const xs = new Uint16Array(b64Bytes(snap.xs).buffer);
+  const ys = new Uint16Array(b64Bytes(snap.ys).buffer);
+  const ds = b64Bytes(snap.d);
+  const rgb = b64Bytes(snap.rgb);
+  const creatures = new Array(snap.n);
+  for (let i = 0; i < snap.n; i++) {
+    creatures[i] = { x: xs[i], y: ys[i], d: ds[i], r: rgb[3 * i], g: rgb[3 * i + 1], b: rgb[3 * i + 2] };
+  }
+  return creatures;
+};
+
 // ── Components (Memoized) ───────────────────────────────────
 
 const NeuralDiagram = memo(({ creature }) => {
@@ -195,7 +211,7 @@ export default function EvoSim() {
     es.onmessage = (event) => {
       const data = JSON.parse(event.data);
       if (data.type === "generation") {
-        creaturesRef.current = data.snapshot || [];
+        creaturesRef.current = decodeSnapshot(data.snapshot);
         statsRef.current = {
           gen: data.gen, survivors: data.survivors, population: data.population,
           diversity: data.diversity, murders: data.murders, survivalPct: data.survivalPct
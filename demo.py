@@ -7,12 +7,13 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from simulation import Simulation
 from visualizer import (ensure_dirs, save_world_snapshot,
-                         save_evolution_chart, save_neural_diagram, append_csv)
+                         save_evolution_chart, save_neural_diagram, append_csv,
+                         drain, StatsBuffer)
 
 OUT = "output/demo"
 ensure_dirs(OUT)
 
-all_stats = []
+all_stats = StatsBuffer()
 
 def on_gen(gen_idx, stats, world, creatures, survivors):
     all_stats.append(stats)
@@ -36,4 +37,5 @@ sim = Simulation(
 sim.run()
 
 save_evolution_chart(all_stats, OUT, "demo_chart.png")
+drain()
 print("\nAll outputs in:", OUT)
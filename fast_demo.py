@@ -7,11 +7,12 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from simulation import Simulation
 from visualizer import (ensure_dirs, save_world_snapshot,
-                         save_evolution_chart, save_neural_diagram, append_csv)
+                         save_evolution_chart, save_neural_diagram, append_csv,
+                         drain, StatsBuffer)
 
 OUT = "output/demo"
 ensure_dirs(OUT)
-all_stats = []
+all_stats = StatsBuffer()
 
 def on_gen(gen_idx, stats, world, creatures, survivors):
     all_stats.append(stats)
@@ -39,6 +40,7 @@ save_evolution_chart(all_stats, OUT, "demo_chart.png")
 # Save final snapshot
 survivors_final = [c for c in sim.current_gen_creatures if c.alive]
 save_world_snapshot(sim.world, sim.generation, survivors_final, "east", OUT)
+drain()
 print("\nAll outputs in:", OUT)
 print("Files:")
 for root, dirs, files in os.walk(OUT):
@@ -50,6 +50,33 @@ def decode_gene(gene: int) -> dict:
     }
 
 
+def decode_genomes(genomes: np.ndarray) -> tuple:
+    """
+    Vectorized ``decode_gene`` over a uint32 array of any shape – a single
+    genome (G,) or a whole population (pop, G).
+
+    Returns five arrays of the input's shape:
+        (source_type, source_id, sink_type, sink_id, weight)
+    with int8 types, int16 (clamped) ids and float32 weights.
+    """
+    genomes     = np.asarray(genomes, dtype=np.uint32)
+    source_type = ((genomes >> 31) & 0x1).astype(np.int8)
+    source_id   = ((genomes >> 24) & 0x7F).astype(np.int16)
+    sink_type   = ((genomes >> 23) & 0x1).astype(np.int8)
+    sink_id     = ((genomes >> 16) & 0x7F).astype(np.int16)
+    # signed 16-bit weight
+    raw_weight  = (genomes & 0xFFFF).astype(np.uint16).view(np.int16)
+    weight      = raw_weight.astype(np.float32) / WEIGHT_DIVISOR
+
+    # Clamp indices to valid range
+    n_internal  = max(1, MAX_INTERNAL_NEURONS)
+    source_id   = np.where(source_type == 0, source_id % NUM_SENSORS,
+                           source_id % n_internal).astype(np.int16)
+    sink_id     = np.where(sink_type == 1, sink_id % NUM_ACTIONS,
+                           sink_id % n_internal).astype(np.int16)
+    return source_type, source_id, sink_type, sink_id, weight
+
+
 def encode_gene(source_type: int, source_id: int,
                 sink_type: int,   sink_id: int,
                 weight_float: float) -> int:
@@ -70,36 +97,60 @@ def encode_gene(source_type: int, source_id: int,
 # Population-level operations
 # ──────────────────────────────────────────────────────────────────────────────
 
-def random_genome(size: int = GENOME_SIZE, rng=None) -> list:
-    """Generate a random genome as a list of 32-bit ints."""
+def random_genome(size: int = GENOME_SIZE, rng=None) -> np.ndarray:
+    """Generate a random genome as a uint32 array of genes."""
     if rng is None:
         rng = np.random.default_rng()
-    # Use uint32, interpret as int32 for signedness
-    return list(rng.integers(0, 2**32, size=size, dtype=np.uint32).astype(np.int32))
+    return rng.integers(0, 2**32, size=size, dtype=np.uint32)
+
 
+def random_genome_batch(pop: int, size: int = GENOME_SIZE,
+                        rng=None) -> np.ndarray:
+    """Generate `pop` random genomes as a (pop, size) uint32 matrix."""
+    if rng is None:
+        rng = np.random.default_rng()
+    return rng.integers(0, 2**32, size=(pop, size), dtype=np.uint32)
 
-def mutate_genome(genome: list, rate: float = MUTATION_RATE, rng=None) -> list:
+
+def mutate_population(genomes: np.ndarray, rate: float = MUTATION_RATE,
+                      rng=None) -> np.ndarray:
     """
-    Flip individual bits with probability `rate` per bit.
-    Each 32-bit gene has 32 bits → expected flips ≈ rate * 32 per gene.
+    Flip individual bits with probability `rate` per bit across a whole
+    (pop, genome_size) uint32 genome matrix at once.
+
+    Rather than drawing one random number per bit, the total number of
+    flips is drawn from Binomial(n_bits, rate) and that many distinct bit
+    positions are picked – the same distribution, but the cost scales
+    with the number of mutations instead of the number of bits.
+    Returns a mutated copy.
     """
     if rng is None:
         rng = np.random.default_rng()
-    mutated = []
-    for gene in genome:
-        gene = int(gene) & 0xFFFFFFFF   # treat as uint32
-        for bit in range(32):
-            if rng.random() < rate:
-                gene ^= (1 << bit)
-        gene &= 0xFFFFFFFF
-        # Reinterpret as signed int32
-        if gene >= 0x80000000:
-            gene -= 0x100000000
-        mutated.append(int(gene))
+    mutated = np.array(genomes, dtype=np.uint32)
+    n_bits  = mutated.size * 32
+    if n_bits == 0 or rate <= 0:
+        return mutated
+    n_flips = int(rng.binomial(n_bits, min(rate, 1.0)))
+    if n_flips:
+        bits = rng.choice(n_bits, size=n_flips, replace=False)
+        masks = np.left_shift(np.uint32(1), (bits % 32).astype(np.uint32))
+        np.bitwise_xor.at(mutated.reshape(-1), bits // 32, masks)
     return mutated
 
 
-def crossover(genome_a: list, genome_b: list, rng=None) -> list:
+def mutate_genome(genome: np.ndarray, rate: float = MUTATION_RATE,
+                  rng=None) -> np.ndarray:
+    """
+    Flip individual bits with probability `rate` per bit.
+    Each 32-bit gene has 32 bits → expected flips ≈ rate * 32 per gene.
+    Single-genome wrapper around ``mutate_population``.
+    """
+    genes = np.asarray(genome, dtype=np.int64).astype(np.uint32)
+    return mutate_population(genes[None, :], rate, rng)[0]
+
+
+def crossover(genome_a: np.ndarray, genome_b: np.ndarray,
+              rng=None) -> np.ndarray:
     """
     Single-point crossover: pick a random split point, take genes
     [0:split] from parent A and [split:] from parent B.
@@ -108,31 +159,80 @@ def crossover(genome_a: list, genome_b: list, rng=None) -> list:
         rng = np.random.default_rng()
     size = len(genome_a)
     split = int(rng.integers(0, size + 1))
-    return list(genome_a[:split]) + list(genome_b[split:])
+    return np.concatenate((genome_a[:split], genome_b[split:]))
 
 
-def genome_similarity(genome_a: list, genome_b: list) -> float:
+def crossover_batch(parents_a: np.ndarray, parents_b: np.ndarray,
+                    rng=None) -> np.ndarray:
+    """
+    Vectorized single-point crossover over (pop, G) parent matrices: each
+    child row takes genes [0:split] from `parents_a` and [split:] from
+    `parents_b`, with an independent random split per child.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    pop, size = parents_a.shape
+    splits = rng.integers(0, size + 1, size=pop)
+    mask   = np.arange(size)[None, :] < splits[:, None]
+    return np.where(mask, parents_a, parents_b)
+
+
+def genome_similarity(genome_a, genome_b) -> float:
     """
     Genetic similarity (0..1) based on fraction of identical bits.
     Used by the genetic-compatibility sensory neuron.
     """
-    if not genome_a or not genome_b:
+    if len(genome_a) == 0 or len(genome_b) == 0:
         return 0.0
     total_bits = 0
     matching   = 0
     for a, b in zip(genome_a, genome_b):
-        xor = int(a) ^ int(b)
-        matching   += 32 - bin(xor).count('1')
+        xor = (int(a) ^ int(b)) & 0xFFFFFFFF
+        matching   += 32 - xor.bit_count()
         total_bits += 32
     return matching / total_bits if total_bits else 1.0
 
 
-def genome_to_color(genome: list) -> tuple:
+if hasattr(np, "bitwise_count"):            # NumPy ≥ 2.0
+    def _popcount32(x: np.ndarray) -> np.ndarray:
+        """Number of set bits in each element of a uint32 array."""
+        return np.bitwise_count(x)
+else:
+    _POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)],
+                          dtype=np.uint8)
+
+    def _popcount32(x: np.ndarray) -> np.ndarray:
+        """Number of set bits in each element of a uint32 array."""
+        x = np.asarray(x, dtype=np.uint32)
+        return (_POPCOUNT8[x & 0xFF] + _POPCOUNT8[(x >> 8) & 0xFF] +
+                _POPCOUNT8[(x >> 16) & 0xFF] + _POPCOUNT8[x >> 24])
+
+
+def similarity_batch(a: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """
+    Vectorized ``genome_similarity`` over uint32 genome arrays.
+
+    `a` is either a single genome of shape (G,), compared against every
+    row of `B` (N, G), or an (N, G) matrix compared row by row with `B`.
+    Returns a float array of shape (N,).  Leading axes broadcast, so
+    ``similarity_batch(M[:, None], M[None])`` gives the full pairwise
+    (N, N) similarity matrix of a genome matrix M.
+    """
+    a = np.asarray(a, dtype=np.uint32)
+    B = np.asarray(B, dtype=np.uint32)
+    G = B.shape[-1]
+    if G == 0:
+        return np.zeros(B.shape[:-1], dtype=np.float32)
+    hamming = _popcount32(a ^ B).sum(axis=-1, dtype=np.int64)
+    return 1.0 - hamming / (32.0 * G)
+
+
+def genome_to_color(genome: np.ndarray) -> tuple:
     """
     Map a genome to an RGB colour so that genetically similar creatures
     have similar colours (useful visual diversity indicator).
     """
-    if not genome:
+    if len(genome) == 0:
         return (128, 128, 128)
     # XOR-fold all genes into 24 bits
     h = 0
@@ -146,3 +246,18 @@ def genome_to_color(genome: list) -> tuple:
     g = max(50, g)
     b = max(50, b)
     return (r, g, b)
+
+
+def genome_colors_batch(genomes: np.ndarray) -> np.ndarray:
+    """
+    Vectorized ``genome_to_color`` for a (pop, G) uint32 genome matrix.
+    Returns a (pop, 3) uint8 array of RGB colours.
+    """
+    genomes = np.asarray(genomes, dtype=np.uint32)
+    if genomes.shape[1] == 0:
+        return np.full((len(genomes), 3), 128, dtype=np.uint8)
+    # XOR-fold all genes into 24 bits
+    h = np.bitwise_xor.reduce(genomes & 0xFFFFFF, axis=1)
+    rgb = np.stack([(h >> 16) & 0xFF, (h >> 8) & 0xFF, h & 0xFF], axis=1)
+    # Brighten so they're visible
+    return np.maximum(rgb, 50).astype(np.uint8)
@@ -20,8 +20,10 @@ import sys
 
 from simulation  import Simulation
 from visualizer  import (ensure_dirs, save_world_snapshot,
-                          save_evolution_chart, save_neural_diagram,
-                          append_csv)
+                          save_world_snapshot_fast, save_evolution_chart,
+                          save_neural_diagram,
+                          append_csv, drain, SnapshotVideoWriter,
+                          StatsBuffer)
 from config import (SAVE_DIR, SNAPSHOT_INTERVAL, SAVE_NEURAL_SAMPLE,
                     POPULATION, MAX_GENERATIONS, STEPS_PER_GEN,
                     GENOME_SIZE, MUTATION_RATE)
@@ -55,6 +57,12 @@ def parse_args():
                    help="Output directory")
     p.add_argument("--snapshot_interval", type=int, default=SNAPSHOT_INTERVAL,
                    help="Save world snapshot every N generations")
+    p.add_argument("--video",      action="store_true",
+                   help="Also record every generation to snapshots.mp4 "
+                        "(needs PyAV)")
+    p.add_argument("--fast_snapshots", action="store_true",
+                   help="Draw snapshots straight with Pillow instead of "
+                        "Matplotlib (no axes, much faster)")
     return p.parse_args()
 
 
@@ -66,11 +74,15 @@ class SimCallbacks:
     """Bundles the per-generation callbacks used by the simulation."""
 
     def __init__(self, outdir: str, snapshot_interval: int,
-                 all_stats: list, selection_mode: str):
+                 all_stats: StatsBuffer, selection_mode: str, video=None,
+                 fast_snapshots: bool = False):
         self.outdir           = outdir
         self.snapshot_interval = snapshot_interval
         self.all_stats        = all_stats
         self.selection_mode   = selection_mode
+        self.video            = video     # SnapshotVideoWriter or None
+        self.save_snapshot    = (save_world_snapshot_fast if fast_snapshots
+                                 else save_world_snapshot)
 
     def on_generation(self, gen_idx, stats, world, creatures, survivors):
         # Append to stats list
@@ -79,9 +91,13 @@ class SimCallbacks:
         # CSV log
         append_csv(stats, self.outdir)
 
+        # Video frame (every generation)
+        if self.video is not None:
+            self.video.write(world, gen_idx, survivors, self.selection_mode)
+
         # Save snapshot
         if gen_idx % self.snapshot_interval == 0:
-            path = save_world_snapshot(
+            path = self.save_snapshot(
                 world, gen_idx, survivors,
                 self.selection_mode, self.outdir)
             print(f"  → Snapshot: {path}")
@@ -174,13 +190,16 @@ def main():
         import config
         config.KILL_ENABLED = True
 
-    all_stats = []
+    all_stats = StatsBuffer()
 
     cb = SimCallbacks(
         outdir           = outdir,
         snapshot_interval = args.snapshot_interval,
         all_stats        = all_stats,
         selection_mode   = args.scenario if args.scenario != "kill" else "center",
+        video            = (SnapshotVideoWriter(os.path.join(outdir, "snapshots.mp4"))
+                            if args.video else None),
+        fast_snapshots   = args.fast_snapshots,
     )
 
     sim = Simulation(
@@ -194,7 +213,12 @@ def main():
         on_gen_callback = cb.on_generation,
     )
 
-    sim.run()
+    try:
+        sim.run()
+    finally:
+        # Write the MP4 trailer even if the run dies or is interrupted
+        if cb.video is not None:
+            cb.video.close()
 
     # Final chart
     print("\nSaving final evolution chart …")
@@ -204,11 +228,15 @@ def main():
     # Final world snapshot
     if sim.current_gen_creatures:
         survivors = [c for c in sim.current_gen_creatures if c.alive]
-        snap = save_world_snapshot(
+        snap = cb.save_snapshot(
             sim.world, sim.generation, survivors,
             sim.selection_mode, outdir)
         print(f"  → Final snapshot: {snap}")
 
+    if cb.video is not None:
+        print(f"  → Video: {cb.video.path}")
+
+    drain()     # wait for the background PNG writes to land
     print("\nDone! All outputs saved to:", outdir)
 
 
@@ -11,73 +11,231 @@ Forward pass (per simulation step):
 """
 
 import numpy as np
-from genome import decode_gene
+from collections import deque
+from genome import decode_genomes
 from config import NUM_SENSORS, NUM_ACTIONS, MAX_INTERNAL_NEURONS
 
 
+def _forward(W_s: np.ndarray, W_ii: np.ndarray, W_ia: np.ndarray,
+             sensor_inputs: np.ndarray, internal: np.ndarray,
+             actions: np.ndarray, drive: np.ndarray, scratch: np.ndarray):
+    """
+    Forward pass kernel shared by every brain.
+
+    `W_s` stacks the sensor → internal and sensor → action weights, so the
+    sensor drive of every sink comes out of a single product; it is the
+    same on each internal pass and is only added back in.
+
+    Nothing is allocated: the results land in `internal` (n_internal,) and
+    `actions` (n_actions,), while `drive` (n_internal + n_actions,) and
+    `scratch` (n_internal,) are work buffers.
+    """
+    n_internal = len(internal)
+    np.matmul(W_s, sensor_inputs, out=drive)
+
+    # Propagate into internal neurons first (2 passes lets signals
+    # propagate through multi-hop internal chains).  Internals start at
+    # zero, so the first pass is just the activated sensor drive.
+    np.tanh(drive[:n_internal], out=internal)
+    np.matmul(W_ii, internal, out=scratch)
+    scratch += drive[:n_internal]
+    np.tanh(scratch, out=internal)
+
+    # Fire action neurons
+    np.matmul(W_ia, internal, out=actions)
+    actions += drive[n_internal:]
+    np.tanh(actions, out=actions)
+
+
+def build_weight_batch(decoded: tuple) -> tuple:
+    """
+    Fold a whole population's decoded genes – the (pop, G) field arrays
+    from ``decode_genomes`` – into stacked weight tensors laid out like a
+    single brain's:
+        W_s   (pop, n_internal + n_actions, n_sensors)
+        W_ii  (pop, n_internal, n_internal)
+        W_ia  (pop, n_actions,  n_internal)
+    Dead ends are not pruned: those connections only feed internals that
+    no action ever reads, so they cannot change the outputs.
+    """
+    source_type, source_id, sink_type, sink_id, weight = decoded
+    pop        = source_type.shape[0]
+    n_internal = MAX_INTERNAL_NEURONS
+    owner      = np.broadcast_to(np.arange(pop)[:, None], source_type.shape)
+
+    W_s  = np.zeros((pop, n_internal + NUM_ACTIONS, NUM_SENSORS), dtype=np.float32)
+    W_ii = np.zeros((pop, n_internal, n_internal), dtype=np.float32)
+    W_ia = np.zeros((pop, NUM_ACTIONS, n_internal), dtype=np.float32)
+
+    # Sensor sources: internal sinks fill the top rows of W_s, actions
+    # the rows below them
+    m   = source_type == 0
+    row = np.where(sink_type == 0, sink_id, n_internal + sink_id)
+    np.add.at(W_s, (owner[m], row[m], source_id[m]), weight[m])
+
+    m = (source_type == 1) & (sink_type == 0)
+    np.add.at(W_ii, (owner[m], sink_id[m], source_id[m]), weight[m])
+    m = (source_type == 1) & (sink_type == 1)
+    np.add.at(W_ia, (owner[m], sink_id[m], source_id[m]), weight[m])
+    return W_s, W_ii, W_ia
+
+
+def forward_batch(W_s: np.ndarray, W_ii: np.ndarray, W_ia: np.ndarray,
+                  sensor_inputs: np.ndarray) -> np.ndarray:
+    """
+    ``_forward`` for many brains at once: row m of each weight tensor and
+    of the (M, NUM_SENSORS) `sensor_inputs` belongs to the same creature.
+
+    Returns action_vals: float32 array of shape (M, NUM_ACTIONS), −1..1
+    """
+    n_internal = W_ii.shape[1]
+    drive      = np.einsum("mij,mj->mi", W_s, sensor_inputs)
+
+    # Two internal passes, the first starting from all-zero internals
+    internal  = np.tanh(drive[:, :n_internal])
+    summed    = np.einsum("mij,mj->mi", W_ii, internal)
+    summed   += drive[:, :n_internal]
+    internal  = np.tanh(summed, out=summed)
+
+    summed  = np.einsum("mij,mj->mi", W_ia, internal)
+    summed += drive[:, n_internal:]
+    return np.tanh(summed, out=summed)
+
+
 class NeuralNetwork:
     """
     Tiny neural network built entirely from a creature's genome.
     Topology: sensors → [internals] → actions
     """
 
-    def __init__(self, genome: list):
-        self.genome     = genome
+    def __init__(self, genome: np.ndarray, decoded: tuple = None):
+        """
+        `genome` is a 1-D array of uint32 genes (e.g. a row of
+        World.genomes).  `decoded` optionally supplies its already-decoded
+        fields, i.e. the matching row of ``decode_genomes`` run over the
+        whole population.
+        """
         self.n_sensors  = NUM_SENSORS
         self.n_actions  = NUM_ACTIONS
         self.n_internal = MAX_INTERNAL_NEURONS
 
-        # Parse all genes into connection lists
-        self._connections = self._parse_genome(genome)
+        # Dense weight matrices, one per (source layer → sink layer) pair;
+        # sensor weights for both sink layers live in one stacked matrix.
+        # Allocated once and refilled by every rebind().
+        self._W_s  = np.zeros((self.n_internal + self.n_actions, self.n_sensors),
+                              dtype=np.float32)
+        self._W_si = self._W_s[:self.n_internal]
+        self._W_sa = self._W_s[self.n_internal:]
+        self._W_ii = np.zeros((self.n_internal, self.n_internal), dtype=np.float32)
+        self._W_ia = np.zeros((self.n_actions,  self.n_internal), dtype=np.float32)
 
-        # Prune dead-end internal neurons (inputs but no output path)
-        self._connections = self._prune_dead_ends(self._connections)
-
-        # State vectors (updated each forward pass)
+        # State vectors (updated each forward pass) and forward scratch
         self._internal_vals = np.zeros(self.n_internal, dtype=np.float32)
         self._action_vals   = np.zeros(self.n_actions,  dtype=np.float32)
+        self._drive         = np.zeros(self.n_internal + self.n_actions,
+                                       dtype=np.float32)
+        self._scratch       = np.zeros(self.n_internal, dtype=np.float32)
+
+        self.rebind(genome, decoded)
+
+    def rebind(self, genome: np.ndarray, decoded: tuple = None):
+        """
+        Rebuild this brain in place for a new genome (same arguments as the
+        constructor), reusing its weight and state buffers.
+        """
+        # Own copy: `genome` is usually a view into World.genomes, whose
+        # rows are overwritten by the next generation
+        self.genome = np.array(genome, dtype=np.uint32)
+
+        # Parse all genes into connection arrays (struct-of-arrays, one
+        # entry per connection)
+        (self.src_type, self.src_id,
+         self.snk_type, self.snk_id, self.weights) = self._parse_genome(genome, decoded)
+
+        # Prune dead-end internal neurons (inputs but no output path)
+        self._prune_dead_ends()
+
+        # Fold the surviving connections into the weight matrices
+        self._build_weights()
+
+        self._internal_vals.fill(0.0)
+        self._action_vals.fill(0.0)
 
     # ──────────────────────────────────────────────────────────────────────────
 
-    def _parse_genome(self, genome: list) -> list:
-        """Decode each gene into a connection dict."""
-        connections = []
-        for raw_gene in genome:
-            c = decode_gene(int(raw_gene))
-            connections.append(c)
-        return connections
+    def _parse_genome(self, genome: np.ndarray, decoded: tuple = None) -> tuple:
+        """
+        Decode every gene into the connection arrays
+            (src_type, src_id, snk_type, snk_id, weights)
+        src_type: 0=sensor, 1=internal   snk_type: 0=internal, 1=action
+        """
+        if decoded is None:
+            decoded = decode_genomes(genome)
+        source_type, source_id, sink_type, sink_id, weight = decoded
+        return (source_type.astype(np.int32), source_id.astype(np.int32),
+                sink_type.astype(np.int32),   sink_id.astype(np.int32),
+                weight.astype(np.float32))
 
-    def _prune_dead_ends(self, connections: list) -> list:
+    def _prune_dead_ends(self):
         """
         Remove connections whose sink is an internal neuron that has no
         outgoing path to an action neuron (they'd never affect behaviour).
         """
-        # Find internal neurons that feed at least one action (directly or indirectly)
-        # Iterative: start from internals that directly connect to actions,
-        # then expand backward.
-        useful = set()
-        changed = True
-        while changed:
-            changed = False
-            for c in connections:
-                if c["sink_type"] == 1:                         # → action
-                    # source internal (if any) is useful
-                    if c["source_type"] == 1 and c["source_id"] not in useful:
-                        useful.add(c["source_id"])
-                        changed = True
-                elif c["sink_type"] == 0 and c["sink_id"] in useful:
-                    # this internal feeds a useful internal
-                    if c["source_type"] == 1 and c["source_id"] not in useful:
-                        useful.add(c["source_id"])
-                        changed = True
-
-        pruned = []
-        for c in connections:
-            if c["sink_type"] == 1:
-                pruned.append(c)        # always keep → action connections
-            elif c["sink_id"] in useful:
-                pruned.append(c)        # keep → internal only if useful
-        return pruned
+        to_action   = self.snk_type == 1
+        to_internal = ~to_action
+        from_int    = self.src_type == 1
+
+        # feeders[i] = internal neurons with a connection into internal i
+        feeders = [[] for _ in range(self.n_internal)]
+        inner   = to_internal & from_int
+        for snk, src in zip(self.snk_id[inner].tolist(),
+                            self.src_id[inner].tolist()):
+            feeders[snk].append(src)
+
+        # Find internal neurons that feed at least one action (directly or
+        # indirectly): breadth-first search backward from the internals
+        # that connect straight to an action.
+        useful = [False] * self.n_internal
+        queue  = deque()
+        for src in self.src_id[to_action & from_int].tolist():
+            if not useful[src]:
+                useful[src] = True
+                queue.append(src)
+        while queue:
+            for src in feeders[queue.popleft()]:
+                if not useful[src]:
+                    useful[src] = True
+                    queue.append(src)
+
+        sink_useful = np.zeros(len(self.snk_id), dtype=bool)
+        sink_useful[to_internal] = np.array(useful, dtype=bool)[self.snk_id[to_internal]]
+
+        # always keep → action connections, → internal only if useful
+        keep = to_action | sink_useful
+        self.src_type = self.src_type[keep]
+        self.src_id   = self.src_id[keep]
+        self.snk_type = self.snk_type[keep]
+        self.snk_id   = self.snk_id[keep]
+        self.weights  = self.weights[keep]
+
+    def _build_weights(self):
+        """
+        Fold the connection arrays into four small dense matrices:
+          W_si  sensor   → internal   (n_internal, n_sensors)
+          W_ii  internal → internal   (n_internal, n_internal)
+          W_sa  sensor   → action     (n_actions,  n_sensors)
+          W_ia  internal → action     (n_actions,  n_internal)
+        Duplicate genes for the same edge simply add up, as they did when
+        each connection was accumulated on its own.
+        """
+        self._W_s.fill(0.0)
+        self._W_ii.fill(0.0)
+        self._W_ia.fill(0.0)
+        for mat, src, snk in ((self._W_si, 0, 0), (self._W_sa, 0, 1),
+                              (self._W_ii, 1, 0), (self._W_ia, 1, 1)):
+            mask = (self.src_type == src) & (self.snk_type == snk)
+            np.add.at(mat, (self.snk_id[mask], self.src_id[mask]),
+                      self.weights[mask])
 
     # ──────────────────────────────────────────────────────────────────────────
 
@@ -89,44 +247,41 @@ class NeuralNetwork:
             sensor_inputs: float32 array of shape (NUM_SENSORS,), values 0..1
 
         Returns:
-            action_vals: float32 array of shape (NUM_ACTIONS,), values −1..1
+            action_vals: float32 array of shape (NUM_ACTIONS,), values −1..1.
+                         This is the brain's own buffer, overwritten by the
+                         next call – copy it to keep it.
         """
-        self._internal_vals[:] = 0.0
-        self._action_vals[:]   = 0.0
-
-        # Accumulate weighted inputs into internal neurons first (2 passes
-        # lets signals propagate through multi-hop internal chains).
-        for _ in range(2):
-            new_internal = np.zeros(self.n_internal, dtype=np.float32)
-            for c in self._connections:
-                if c["sink_type"] == 0:   # → internal
-                    src = (sensor_inputs[c["source_id"]]
-                           if c["source_type"] == 0
-                           else self._internal_vals[c["source_id"]])
-                    new_internal[c["sink_id"]] += src * c["weight"]
-            self._internal_vals = np.tanh(new_internal)
-
-        # Accumulate into action neurons
-        action_sums = np.zeros(self.n_actions, dtype=np.float32)
-        for c in self._connections:
-            if c["sink_type"] == 1:   # → action
-                src = (sensor_inputs[c["source_id"]]
-                       if c["source_type"] == 0
-                       else self._internal_vals[c["source_id"]])
-                action_sums[c["sink_id"]] += src * c["weight"]
-
-        self._action_vals = np.tanh(action_sums)
-        return self._action_vals.copy()
+        _forward(self._W_s, self._W_ii, self._W_ia,
+                 np.asarray(sensor_inputs, dtype=np.float32),
+                 self._internal_vals, self._action_vals,
+                 self._drive, self._scratch)
+        return self._action_vals
 
     # ──────────────────────────────────────────────────────────────────────────
 
     def get_active_connections(self) -> list:
-        """Return the pruned connection list (useful for visualisation)."""
-        return self._connections
+        """
+        Return the pruned connections as a list of dicts (useful for
+        visualisation); built on demand from the connection arrays.
+        """
+        return [
+            {
+                "source_type": source_type,
+                "source_id":   source_id,
+                "sink_type":   sink_type,
+                "sink_id":     sink_id,
+                "weight":      weight,
+            }
+            for source_type, source_id, sink_type, sink_id, weight in zip(
+                self.src_type.tolist(), self.src_id.tolist(),
+                self.snk_type.tolist(), self.snk_id.tolist(),
+                self.weights.tolist())
+        ]
 
     def summary(self) -> str:
-        lines = [f"NeuralNetwork ({len(self._connections)} active connections)"]
-        for c in self._connections:
+        connections = self.get_active_connections()
+        lines = [f"NeuralNetwork ({len(connections)} active connections)"]
+        for c in connections:
             src_label = ("S" if c["source_type"] == 0 else "I")
             snk_label = ("I" if c["sink_type"]   == 0 else "A")
             lines.append(
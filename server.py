@@ -9,20 +9,33 @@ Endpoints:
   GET  /stream       SSE stream – browser subscribes here for live data
   GET  /status       Current sim state as JSON
 
+The simulation runs in its own process, so its step loop never competes
+with the request / SSE threads for the GIL; generations come back to the
+server over a multiprocessing queue.
+
 Run:
   python server.py
   # → http://localhost:5000
 """
 
 import threading
+import multiprocessing as mp
 import queue
+import base64
 import json
 import time
 import sys
 import os
+from collections import deque
 
+import numpy as np
 from flask import Flask, Response, request, jsonify
 
+try:
+    import orjson  # optional: several times faster than json for SSE frames
+except ImportError:
+    orjson = None
+
 # Make sure the evosim package is importable from this folder
 sys.path.insert(0, os.path.dirname(__file__))
 
@@ -41,13 +54,16 @@ from config import (
 # ──────────────────────────────────────────────────────────────────────────────
 app = Flask(__name__)
 
-# Global simulation state
-_sim_thread: threading.Thread | None = None
-_stop_event = threading.Event()
-_gen_queue = queue.Queue(maxsize=200)  # holds dicts to stream
+# Global simulation state.  "spawn" keeps the worker independent of the
+# server's threads (forking a threaded process is unsafe).
+_mp = mp.get_context("spawn")
+_sim_proc: mp.Process | None = None
+_stop_event = _mp.Event()
+_gen_queue = _mp.Queue(maxsize=200)  # worker process → server
+_frames = deque(maxlen=200)  # SSE ring buffer, oldest frames fall off
+_sim_running = _mp.Value("b", False)  # written by the worker process
+_sim_generation = _mp.Value("i", 0)
 _sim_status = {
-    "running": False,
-    "generation": 0,
     "max_gen": 0,
     "cfg": {},
 }
@@ -74,7 +90,7 @@ def preflight(p=""):
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-# Simulation thread
+# Simulation process
 # ──────────────────────────────────────────────────────────────────────────────
 
 
@@ -98,26 +114,47 @@ def _build_cfg(data: dict) -> dict:
     }
 
 
-def _sim_worker(cfg: dict, stop_evt: threading.Event, out_q: queue.Queue):
-    """Run full simulation in background thread; push each generation into queue."""
+def _dumps(payload: dict) -> str:
+    """Serialise an SSE frame (orjson when installed, else json)."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(payload)
+
+
+def _b64(arr: np.ndarray) -> str:
+    """Base64 of an array's raw bytes (the dashboard views it as a typed array)."""
+    return base64.b64encode(np.ascontiguousarray(arr).tobytes()).decode("ascii")
+
+
+def _snapshot_columns(world) -> dict:
+    """
+    Columnar snapshot of the living creatures: little-endian uint16 x / y,
+    uint8 heading and packed uint8 r,g,b triples, each base64-encoded.
+    Several times smaller than one JSON object per creature.
+    """
+    live = np.flatnonzero(world.alive_mask)
+    return {
+        "n": len(live),
+        "xs": _b64(world.pos_x[live].astype("<u2")),
+        "ys": _b64(world.pos_y[live].astype("<u2")),
+        "d": _b64(world.last_dir[live].astype(np.uint8)),
+        "rgb": _b64(world.colors[live]),
+    }
+
+
+def _sim_worker(cfg: dict, stop_evt, out_q, running, generation):
+    """
+    Run full simulation in a background process; push each generation into
+    `out_q` and publish progress through the shared `running` / `generation`
+    values.
+    """
 
     def on_gen(gen_idx, stats, world, creatures, survivors):
         if stop_evt.is_set():
             return
 
-        # Build compact creature snapshot (x, y, color)
-        snapshot = [
-            {
-                "x": c.x,
-                "y": c.y,
-                "r": int(c.color[0]),
-                "g": int(c.color[1]),
-                "b": int(c.color[2]),
-                "d": c.last_dir,
-            }
-            for c in creatures
-            if c.alive
-        ]
+        # Build compact creature snapshot (x, y, heading, color)
+        snapshot = _snapshot_columns(world)
 
         # Best survivor genome (top 1 by connection count)
         best_genome = []
@@ -150,15 +187,9 @@ def _sim_worker(cfg: dict, stop_evt: threading.Event, out_q: queue.Queue):
             "bestConns": best_conns,
         }
 
-        with _status_lock:
-            _sim_status["generation"] = gen_idx
+        generation.value = gen_idx
 
-        # Non-blocking put; drop oldest frame if queue full
-        if out_q.full():
-            try:
-                out_q.get_nowait()
-            except queue.Empty:
-                pass
+        # The server drains this queue continuously into its ring buffer
         out_q.put(payload)
 
     # Patch config module so Simulation picks up new values
@@ -191,27 +222,42 @@ def _sim_worker(cfg: dict, stop_evt: threading.Event, out_q: queue.Queue):
     cmod.CORNER_SIZE = cfg["corner_size"]
     cmod.CENTER_RADIUS = cfg["center_radius"]
 
-    with _status_lock:
-        _sim_status["running"] = True
+    running.value = True
 
     try:
         while not stop_evt.is_set():
             # Run one generation manually so we can check stop_evt between gens
             if sim.generation >= cfg["max_generations"]:
                 break
-            from genome import random_genome
+            from genome import random_genome_batch
 
             if sim.generation == 0:
-                genomes = [
-                    random_genome(cfg["genome_size"], sim.rng)
-                    for _ in range(cfg["population"])
-                ]
+                genomes = random_genome_batch(
+                    cfg["population"], cfg["genome_size"], sim.rng
+                )
                 sim._run_all_generations_hooked(genomes, stop_evt)
                 break
     finally:
-        with _status_lock:
-            _sim_status["running"] = False
-        out_q.put({"type": "done", "gen": _sim_status["generation"]})
+        running.value = False
+        out_q.put({"type": "done", "gen": generation.value})
+
+
+def _pump_frames(src, frames: deque, proc):
+    """
+    Move frames from the worker's queue into the SSE ring buffer `frames`
+    until the "done" frame arrives or the worker dies without sending it.
+    The single producer / single consumer deque needs no locking.
+    """
+    while True:
+        try:
+            payload = src.get(timeout=1)
+        except queue.Empty:
+            if not proc.is_alive():
+                return
+            continue
+        frames.append(payload)
+        if payload.get("type") == "done":
+            return
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -261,31 +307,40 @@ _patch_simulation()
 
 @app.route("/start", methods=["POST"])
 def start():
-    global _sim_thread, _stop_event, _gen_queue
+    global _sim_proc, _stop_event, _gen_queue, _frames
 
-    # Stop any running sim
+    # Stop any running sim (it only checks between generations, so don't
+    # leave a slow one behind writing to a stale queue)
     _stop_event.set()
-    if _sim_thread and _sim_thread.is_alive():
-        _sim_thread.join(timeout=3)
+    if _sim_proc and _sim_proc.is_alive():
+        _sim_proc.join(timeout=3)
+        if _sim_proc.is_alive():
+            _sim_proc.terminate()
+            _sim_proc.join()
 
     # Reset
-    _stop_event = threading.Event()
-    _gen_queue = queue.Queue(maxsize=200)
-    with _status_lock:
-        _sim_status["generation"] = 0
-        _sim_status["running"] = False
+    _stop_event = _mp.Event()
+    _gen_queue = _mp.Queue(maxsize=200)
+    _frames = deque(maxlen=200)
+    _sim_generation.value = 0
+    _sim_running.value = False
 
     cfg = _build_cfg(request.get_json(force=True) or {})
     with _status_lock:
         _sim_status["cfg"] = cfg
         _sim_status["max_gen"] = cfg["max_generations"]
 
-    _sim_thread = threading.Thread(
+    _sim_proc = _mp.Process(
         target=_sim_worker,
-        args=(cfg, _stop_event, _gen_queue),
+        args=(cfg, _stop_event, _gen_queue, _sim_running, _sim_generation),
         daemon=True,
     )
-    _sim_thread.start()
+    _sim_proc.start()
+    threading.Thread(
+        target=_pump_frames,
+        args=(_gen_queue, _frames, _sim_proc),
+        daemon=True,
+    ).start()
     return jsonify({"status": "started", "cfg": cfg})
 
 
@@ -309,7 +364,13 @@ def step_one():
 @app.route("/status", methods=["GET"])
 def status():
     with _status_lock:
-        return jsonify(dict(_sim_status))
+        return jsonify(
+            dict(
+                _sim_status,
+                running=bool(_sim_running.value),
+                generation=_sim_generation.value,
+            )
+        )
 
 
 @app.route("/stream", methods=["GET"])
@@ -320,15 +381,21 @@ def stream():
         # Send a hello so the browser knows it's connected
         yield 'data: {"type": "connected"}\n\n'
 
+        last_sent = time.monotonic()
         while True:
             try:
-                payload = _gen_queue.get(timeout=1)
-                yield f"data: {json.dumps(payload)}\n\n"
-                if payload.get("type") == "done":
-                    break
-            except queue.Empty:
-                # Keep-alive ping
-                yield 'data: {"type": "ping"}\n\n'
+                payload = _frames.popleft()
+            except IndexError:
+                if time.monotonic() - last_sent >= 1.0:
+                    # Keep-alive ping
+                    yield 'data: {"type": "ping"}\n\n'
+                    last_sent = time.monotonic()
+                time.sleep(0.05)
+                continue
+            yield f"data: {_dumps(payload)}\n\n"
+            last_sent = time.monotonic()
+            if payload.get("type") == "done":
+                break
 
     return Response(
         event_gen(),
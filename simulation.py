@@ -13,15 +13,16 @@ Orchestrates the full evolutionary loop:
 import numpy as np
 import time
 from world import World
-from creature import Creature
-from genome import (random_genome, crossover, mutate_genome,
-                    genome_similarity)
+from creature import choose_actions
+from neural_network import forward_batch
+from genome import (random_genome_batch, crossover_batch, mutate_population,
+                    similarity_batch)
 from config import (
     WORLD_WIDTH, WORLD_HEIGHT, POPULATION,
     MAX_GENERATIONS, STEPS_PER_GEN, GENOME_SIZE,
     MUTATION_RATE, SELECTION_MODE,
     CENTER_RADIUS, STRIP_WIDTH, CORNER_SIZE,
-    RADIO_MAX_DOSE, RADIO_FALLOFF, KILL_ENABLED,
+    KILL_ENABLED,
 )
 
 
@@ -67,8 +68,8 @@ class Simulation:
     def run(self):
         """Run the full simulation for max_generations generations."""
         # Seed generation 0 with random creatures
-        genomes = [random_genome(self.genome_size, self.rng)
-                   for _ in range(self.population)]
+        genomes = random_genome_batch(self.population, self.genome_size,
+                                      self.rng)
         self._run_all_generations(genomes)
 
     def _run_all_generations(self, initial_genomes):
@@ -102,20 +103,16 @@ class Simulation:
     # One generation
     # ──────────────────────────────────────────────────────────────────────────
 
-    def _run_one_generation(self, genomes: list):
+    def _run_one_generation(self, genomes: np.ndarray):
         """
         Create creatures from genomes, run them for steps_per_gen steps,
         apply selection, and return (survivors, stats_dict).
         """
-        # Build creatures
-        creatures = [
-            Creature(0, 0, genome, self.rng) for genome in genomes
-        ]
+        # Load genomes into the world's creature slots and place them
+        creatures = self.world.reset_for_generation(genomes)
         self.current_gen_creatures = creatures
-
-        # Place on world
-        self.world.populate(creatures)
         self.world.murder_count = 0
+        self._survival_mask = self._survival_zone()
 
         # Simulation loop
         for step in range(self.steps_per_gen):
@@ -123,12 +120,14 @@ class Simulation:
             if self.selection_mode == "radioactive":
                 self._apply_radiation(creatures, step)
 
-            # Each creature takes one step
-            order = self.rng.permutation(len(creatures))
-            for idx in order:
-                c = creatures[idx]
-                if c.alive:
-                    c.step(self.world, step)
+            # Sense → think → act over the living slots only, each stage
+            # batched over the whole population
+            live    = np.flatnonzero(self.world.alive_mask)
+            inputs  = self.world.sense_all(live)
+            actions = forward_batch(
+                *(W[live] for W in self.world.brain_weights), inputs)
+            best_act, strength = choose_actions(actions)
+            self.world.apply_actions(live, best_act, strength)
 
             if self.on_step_callback:
                 self.on_step_callback(step, self.world, creatures)
@@ -144,45 +143,49 @@ class Simulation:
     # Selection criteria
     # ──────────────────────────────────────────────────────────────────────────
 
-    def _select(self, creatures: list) -> list:
+    def _survival_zone(self) -> np.ndarray:
+        """
+        (H, W) bool mask of the cells a creature must end the generation in
+        to survive under the current selection mode.
+        """
         mode = self.selection_mode
         W, H = self.world.width, self.world.height
-        survivors = []
+        mask = np.zeros((H, W), dtype=bool)
 
-        for c in creatures:
-            if not c.alive:
-                continue
-            if mode == "east":
-                if c.x >= W // 2:
-                    survivors.append(c)
+        if mode == "east":
+            mask[:, W // 2:] = True
 
-            elif mode == "west":
-                if c.x < W // 2:
-                    survivors.append(c)
+        elif mode == "west":
+            mask[:, :W // 2] = True
 
-            elif mode == "west_east":
-                if c.x < STRIP_WIDTH or c.x >= W - STRIP_WIDTH:
-                    survivors.append(c)
+        elif mode == "west_east":
+            mask[:, :STRIP_WIDTH] = True
+            mask[:, max(0, W - STRIP_WIDTH):] = True
 
-            elif mode == "corners":
-                if (c.x < CORNER_SIZE or c.x >= W - CORNER_SIZE) and \
-                   (c.y < CORNER_SIZE or c.y >= H - CORNER_SIZE):
-                    survivors.append(c)
+        elif mode == "corners":
+            cols = np.zeros(W, dtype=bool)
+            rows = np.zeros(H, dtype=bool)
+            cols[:CORNER_SIZE] = cols[max(0, W - CORNER_SIZE):] = True
+            rows[:CORNER_SIZE] = rows[max(0, H - CORNER_SIZE):] = True
+            mask[:] = rows[:, None] & cols[None, :]
 
-            elif mode == "center":
-                cx, cy = W // 2, H // 2
-                if (c.x - cx)**2 + (c.y - cy)**2 <= CENTER_RADIUS**2:
-                    survivors.append(c)
+        elif mode == "center":
+            cx, cy = W // 2, H // 2
+            Y, X = np.ogrid[:H, :W]
+            mask[:] = (X - cx)**2 + (Y - cy)**2 <= CENTER_RADIUS**2
 
-            elif mode == "radioactive":
-                # Survive if still alive (radiation has already killed some)
-                survivors.append(c)
+        else:
+            # "radioactive" – survive if still alive (radiation has already
+            # killed some); any other mode – no selection pressure
+            mask[:] = True
 
-            else:
-                # Default: everyone survives (no selection pressure)
-                survivors.append(c)
+        return mask
 
-        return survivors
+    def _select(self, creatures: list) -> list:
+        """Survivors: creatures still alive inside the survival zone."""
+        w    = self.world
+        mask = w.alive_mask & self._survival_mask[w.pos_y, w.pos_x]
+        return [creatures[i] for i in np.flatnonzero(mask)]
 
     # ──────────────────────────────────────────────────────────────────────────
     # Radiation
@@ -193,48 +196,32 @@ class Simulation:
         First half: west wall radiates.  Second half: east wall radiates.
         Dose accumulates; creatures die if dose > threshold.
         """
-        W = self.world.width
-        west_active = step < self.steps_per_gen // 2
-
-        for c in creatures:
-            if not c.alive:
-                continue
-            if west_active:
-                dist = c.x
-            else:
-                dist = W - 1 - c.x
-            # Exponential falloff from wall
-            dose_per_step = np.exp(-RADIO_FALLOFF * dist) * 0.01
-            c.radiation_dose += dose_per_step
-            if c.radiation_dose > RADIO_MAX_DOSE:
-                c.alive = False
-                self.world.remove_creature(c)
+        self.world.apply_radiation(west_active=step < self.steps_per_gen // 2)
 
     # ──────────────────────────────────────────────────────────────────────────
     # Reproduction
     # ──────────────────────────────────────────────────────────────────────────
 
-    def _reproduce(self, survivors: list) -> list:
+    def _reproduce(self, survivors: list) -> np.ndarray:
         """
-        Produce exactly self.population new genomes from survivors.
+        Produce exactly self.population new genomes from survivors, as a
+        (population, genome_size) uint32 matrix.
         Uses random pairing + crossover + mutation.
         """
         if not survivors:
             # Full random restart if extinction
-            return [random_genome(self.genome_size, self.rng)
-                    for _ in range(self.population)]
+            return random_genome_batch(self.population, self.genome_size,
+                                       self.rng)
 
-        new_genomes = []
-        n = len(survivors)
-        while len(new_genomes) < self.population:
-            # Pick two parents randomly (with replacement)
-            pa = survivors[int(self.rng.integers(0, n))]
-            pb = survivors[int(self.rng.integers(0, n))]
-            child_genome = crossover(pa.genome, pb.genome, self.rng)
-            child_genome = mutate_genome(child_genome, self.mutation_rate, self.rng)
-            new_genomes.append(child_genome)
+        # Pick two parents per child randomly (with replacement)
+        parent_genomes = self.world.genomes[[c.idx for c in survivors]]
+        n  = len(survivors)
+        pa = parent_genomes[self.rng.integers(0, n, size=self.population)]
+        pb = parent_genomes[self.rng.integers(0, n, size=self.population)]
 
-        return new_genomes[:self.population]
+        # Crossover and mutate the whole brood in vectorized passes
+        children = crossover_batch(pa, pb, self.rng)
+        return mutate_population(children, self.mutation_rate, self.rng)
 
     # ──────────────────────────────────────────────────────────────────────────
     # Stats
@@ -243,7 +230,7 @@ class Simulation:
     def _compute_stats(self, creatures: list, survivors: list) -> dict:
         n_pop       = len(creatures)
         n_survivors = len(survivors)
-        n_alive     = sum(1 for c in creatures if c.alive)
+        n_alive     = self.world.alive_count
         n_murdered  = self.world.murder_count
 
         # Genetic diversity: average pairwise Hamming distance (sampled)
@@ -268,14 +255,12 @@ class Simulation:
             return 0.0
         sample_size = min(sample, len(creatures))
         idx = self.rng.choice(len(creatures), sample_size, replace=False)
-        sampled = [creatures[i] for i in idx]
-        total, count = 0.0, 0
-        for i in range(len(sampled)):
-            for j in range(i + 1, len(sampled)):
-                sim = genome_similarity(sampled[i].genome, sampled[j].genome)
-                total += (1.0 - sim)
-                count += 1
-        return total / count if count else 0.0
+        sampled = self.world.genomes[[creatures[i].idx for i in idx]]
+
+        # All pairwise similarities at once (XOR + popcount), averaged
+        # over the distinct pairs above the diagonal
+        sim = similarity_batch(sampled[:, None, :], sampled[None, :, :])
+        return float(np.mean(1.0 - sim[np.triu_indices(sample_size, k=1)]))
 
     def _print_stats(self, gen_idx: int, stats: dict):
         if gen_idx % 10 == 0 or gen_idx < 5:
@@ -2,26 +2,83 @@
 Visualizer for EvoSim.
 
 Produces:
-  1. World snapshots  – coloured scatter plot of creature positions
+  1. World snapshots  – one coloured pixel per occupied world cell
   2. Evolution chart  – survivors + diversity + murders over generations
   3. Neural network diagrams – wiring of a sampled creature's brain
   4. CSV log          – per-generation stats
+  5. Snapshot video   – every generation as one MP4 (needs PyAV)
+
+PNGs are written with zlib level PNG_COMPRESS_LEVEL (config.py, default 1):
+much faster to encode than Matplotlib's default level 6, for files roughly
+20-25% larger.  Set it back to 6 for archival runs.
+
+Figures are rendered on the calling thread, but PNG encoding and the disk
+write happen on a small background pool, so the save_* functions return
+before their file exists.  Call drain() before reading the images.
 """
 
 import os
 import csv
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import matplotlib
 matplotlib.use("Agg")          # non-interactive backend (no display needed)
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection
 from matplotlib.colors import to_rgb
+from PIL import Image
+
+try:
+    import av  # optional: PyAV, for SnapshotVideoWriter
+except ImportError:
+    av = None
 
 from config import (
-    WORLD_WIDTH, WORLD_HEIGHT, SAVE_DIR, LOG_CSV,
+    WORLD_WIDTH, WORLD_HEIGHT, SAVE_DIR, LOG_CSV, PNG_COMPRESS_LEVEL,
     NUM_SENSORS, NUM_ACTIONS, SENSOR_LABELS, ACTION_LABELS,
 )
 
+# Forwarded to Pillow's PNG encoder for every image written below
+_PNG_KWARGS = {"compress_level": PNG_COMPRESS_LEVEL}
+
+# PNG encoding runs here (zlib releases the GIL, so threads are enough)
+_WRITER_POOL = ThreadPoolExecutor(max_workers=2,
+                                  thread_name_prefix="png-writer")
+_pending     = {}    # path → Future of the latest write queued for it
+
+
+def _write_png(path: str, pixels: np.ndarray):
+    Image.fromarray(pixels).save(path, "PNG", **_PNG_KWARGS)
+
+
+def _submit_png(path: str, pixels: np.ndarray):
+    """Queue an (H, W, 3|4) uint8 array to be written as a PNG."""
+    # Two pool threads must never write the same file at once (e.g. the
+    # chart, or a final snapshot of an interval generation): let the
+    # earlier write finish first
+    earlier = _pending.pop(path, None)
+    if earlier is not None:
+        earlier.result()
+    _pending[path] = _WRITER_POOL.submit(_write_png, path, pixels)
+    # Drop finished writes so the dict stays short; surface their errors
+    for done in [p for p, f in _pending.items() if f.done()]:
+        _pending.pop(done).result()
+
+
+def _queue_png(fig, path: str):
+    """Render `fig` now and hand the pixels to the writer pool."""
+    fig.canvas.draw()
+    # Copy: the cached figures are redrawn into the same buffer next call
+    _submit_png(path, np.array(fig.canvas.buffer_rgba()))
+
+
+def drain():
+    """Block until every queued PNG has been written to disk."""
+    while _pending:
+        _pending.popitem()[1].result()
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Directory setup
@@ -36,56 +93,102 @@ def ensure_dirs(base: str = SAVE_DIR):
 # World snapshot
 # ──────────────────────────────────────────────────────────────────────────────
 
-def save_world_snapshot(world, generation: int, survivors: list,
-                        selection_mode: str, base: str = SAVE_DIR):
-    """
-    Render the current world as a scatter plot.
-    Survivors are highlighted with a white ring.
-    """
+# Snapshot figures are built once per world size and reused: each call only
+# repaints the cell raster and title.  Zone overlays are built once per
+# selection mode and shown/hidden as the mode changes
+_SNAPSHOT_CACHE = {}
+
+
+def _snapshot_figure(W: int, H: int) -> dict:
+    """Return the cached snapshot figure for a W×H world, building it once."""
+    cached = _SNAPSHOT_CACHE.get((W, H))
+    if cached is not None:
+        return cached
+
     fig, ax = plt.subplots(figsize=(6, 6), dpi=100)
-    ax.set_xlim(-1, world.width)
-    ax.set_ylim(-1, world.height)
+    # Fixed margins instead of bbox_inches="tight", which renders twice
+    fig.subplots_adjust(left=0.08, right=0.98, top=0.94, bottom=0.05)
     ax.set_aspect("equal")
     ax.set_facecolor("#111111")
     fig.patch.set_facecolor("#111111")
-    ax.set_title(f"Generation {generation}  "
-                 f"({len(survivors)}/{len(world.creatures)} survived)",
-                 color="white", fontsize=10)
     ax.tick_params(colors="white")
     for spine in ax.spines.values():
         spine.set_edgecolor("#444444")
 
-    positions, colors = world.snapshot()
-    if positions:
-        xs = [p[0] for p in positions]
-        ys = [p[1] for p in positions]
-        rgba = [[r/255, g/255, b/255, 1.0] for (r, g, b) in colors]
-        ax.scatter(xs, ys, c=rgba, s=4, linewidths=0)
+    # Creatures are painted straight into an RGBA raster with one pixel per
+    # world cell (empty cells transparent) and shown with imshow – far
+    # cheaper than stamping thousands of scatter markers
+    raster = np.zeros((H, W, 4), dtype=np.uint8)
+    cached = _SNAPSHOT_CACHE[(W, H)] = {
+        "fig":    fig,
+        "ax":     ax,
+        "title":  ax.set_title("", color="white", fontsize=10),
+        "raster": raster,
+        "image":  ax.imshow(raster, origin="lower", interpolation="nearest",
+                            extent=(-0.5, W - 0.5, -0.5, H - 0.5)),
+        "zones":  {},        # selection mode → its overlay artists
+        "mode":   None,      # mode whose overlay is currently visible
+    }
+    ax.set_xlim(-1, W)       # imshow autoscales to its extent; restore
+    ax.set_ylim(-1, H)
+    return cached
+
+
+def save_world_snapshot(world, generation: int, survivors: list,
+                        selection_mode: str, base: str = SAVE_DIR):
+    """
+    Render the current world as a cell raster, one pixel per creature.
+    """
+    cached = _snapshot_figure(world.width, world.height)
+    fig, ax = cached["fig"], cached["ax"]
+    cached["title"].set_text(f"Generation {generation}  "
+                             f"({len(survivors)}/{len(world.creatures)} survived)")
 
-    # Draw selection zones
-    _draw_selection_zone(ax, selection_mode, world.width, world.height)
+    positions, colors = world.snapshot()
+    raster = cached["raster"]
+    raster.fill(0)
+    xs, ys = positions[:, 0], positions[:, 1]
+    raster[ys, xs, :3] = colors
+    raster[ys, xs, 3]  = 255
+    cached["image"].set_data(raster)
+
+    # Selection zones
+    if selection_mode != cached["mode"]:
+        zones = cached["zones"]
+        for artist in zones.get(cached["mode"], ()):
+            artist.set_visible(False)
+        if selection_mode in zones:
+            for artist in zones[selection_mode]:
+                artist.set_visible(True)
+        else:
+            zones[selection_mode] = _draw_selection_zone(
+                ax, selection_mode, world.width, world.height)
+        cached["mode"] = selection_mode
 
     path = os.path.join(base, "snapshots", f"gen_{generation:06d}.png")
-    plt.savefig(path, dpi=100, bbox_inches="tight", facecolor=fig.get_facecolor())
-    plt.close(fig)
+    _queue_png(fig, path)
     return path
 
 
-def _draw_selection_zone(ax, mode: str, W: int, H: int):
-    """Overlay the safe/spawn zone in transparent green."""
+def _draw_selection_zone(ax, mode: str, W: int, H: int) -> list:
+    """
+    Overlay the safe/spawn zone in transparent green.
+    Returns the artists added to `ax`.
+    """
     from config import STRIP_WIDTH, CORNER_SIZE, CENTER_RADIUS
     alpha = 0.15
     color = "lime"
+    artists = []
 
     if mode == "east":
-        ax.axvspan(W // 2, W, alpha=alpha, color=color)
+        artists.append(ax.axvspan(W // 2, W, alpha=alpha, color=color))
 
     elif mode == "west":
-        ax.axvspan(0, W // 2, alpha=alpha, color=color)
+        artists.append(ax.axvspan(0, W // 2, alpha=alpha, color=color))
 
     elif mode == "west_east":
-        ax.axvspan(0, STRIP_WIDTH, alpha=alpha, color=color)
-        ax.axvspan(W - STRIP_WIDTH, W, alpha=alpha, color=color)
+        artists.append(ax.axvspan(0, STRIP_WIDTH, alpha=alpha, color=color))
+        artists.append(ax.axvspan(W - STRIP_WIDTH, W, alpha=alpha, color=color))
 
     elif mode == "corners":
         for rx, ry in [(0, 0), (W-CORNER_SIZE, 0),
@@ -93,47 +196,222 @@ def _draw_selection_zone(ax, mode: str, W: int, H: int):
             rect = mpatches.Rectangle(
                 (rx, ry), CORNER_SIZE, CORNER_SIZE,
                 linewidth=0, edgecolor=None, facecolor=color, alpha=alpha)
-            ax.add_patch(rect)
+            artists.append(ax.add_patch(rect))
 
     elif mode == "center":
         circle = mpatches.Circle(
             (W//2, H//2), CENTER_RADIUS,
             color=color, alpha=alpha)
-        ax.add_patch(circle)
+        artists.append(ax.add_patch(circle))
 
     elif mode == "radioactive":
         # Show radioactive walls in red
-        ax.axvspan(0, W * 0.1, alpha=0.1, color="red")
-        ax.axvspan(W * 0.9, W, alpha=0.1, color="red")
+        artists.append(ax.axvspan(0, W * 0.1, alpha=0.1, color="red"))
+        artists.append(ax.axvspan(W * 0.9, W, alpha=0.1, color="red"))
+
+    return artists
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Fast world snapshot (Pillow only)
+# ──────────────────────────────────────────────────────────────────────────────
+
+_FAST_BG      = np.array((0x11, 0x11, 0x11), dtype=np.float32)
+_FAST_TITLE_H = 14           # px of title bar above the world raster
+
+# (mode, W, H) → (H, W, 3) uint8 background with the zone tint blended in
+_FAST_BG_CACHE = {}
+
+
+def _fast_background(mode: str, W: int, H: int) -> np.ndarray:
+    """
+    The empty-world raster for `mode`, row 0 = world y 0.  Zones use the
+    same geometry and colours as _draw_selection_zone.
+    """
+    cached = _FAST_BG_CACHE.get((mode, W, H))
+    if cached is not None:
+        return cached
+
+    from config import STRIP_WIDTH, CORNER_SIZE, CENTER_RADIUS
+    img  = np.empty((H, W, 3), dtype=np.float32)
+    img[:] = _FAST_BG
+    mask = np.zeros((H, W), dtype=bool)
+    tint, alpha = np.array(to_rgb("lime")) * 255, 0.15
+
+    if mode == "east":
+        mask[:, W // 2:] = True
+    elif mode == "west":
+        mask[:, :W // 2] = True
+    elif mode == "west_east":
+        mask[:, :STRIP_WIDTH] = True
+        mask[:, max(0, W - STRIP_WIDTH):] = True
+    elif mode == "corners":
+        for rows in (slice(0, CORNER_SIZE), slice(max(0, H - CORNER_SIZE), H)):
+            mask[rows, :CORNER_SIZE] = True
+            mask[rows, max(0, W - CORNER_SIZE):] = True
+    elif mode == "center":
+        Y, X = np.ogrid[:H, :W]
+        mask[:] = (X - W // 2)**2 + (Y - H // 2)**2 <= CENTER_RADIUS**2
+    elif mode == "radioactive":
+        X = np.arange(W)
+        mask[:] = (X < W * 0.1) | (X >= W * 0.9)
+        tint, alpha = np.array(to_rgb("red")) * 255, 0.1
+
+    img[mask] = img[mask] * (1.0 - alpha) + tint * alpha
+    cached = _FAST_BG_CACHE[(mode, W, H)] = img.astype(np.uint8)
+    return cached
+
+
+def save_world_snapshot_fast(world, generation: int, survivors: list,
+                             selection_mode: str, base: str = SAVE_DIR,
+                             scale: int = 4):
+    """
+    Like save_world_snapshot, but rasterised straight into a uint8 array
+    and encoded by Pillow: one `scale`×`scale` block per world cell under
+    a plain title bar, with no axes.  Much cheaper than going through
+    Matplotlib, for long runs or video frames.
+    """
+    path = os.path.join(base, "snapshots", f"gen_{generation:06d}.png")
+    _submit_png(path, render_world_frame(world, generation, survivors,
+                                         selection_mode, scale))
+    return path
+
+
+def render_world_frame(world, generation: int, survivors: list,
+                       selection_mode: str, scale: int = 4) -> np.ndarray:
+    """The save_world_snapshot_fast image as an (H, W, 3) uint8 array."""
+    from PIL import ImageDraw
+    W, H = world.width, world.height
+    cells = _fast_background(selection_mode, W, H).copy()
+    positions, colors = world.snapshot()
+    cells[positions[:, 1], positions[:, 0]] = colors
+
+    # Flip so world y grows upwards, then blow each cell up to scale×scale
+    cells = cells[::-1].repeat(scale, axis=0).repeat(scale, axis=1)
+    img = np.empty((_FAST_TITLE_H + cells.shape[0], cells.shape[1], 3),
+                   dtype=np.uint8)
+    img[:_FAST_TITLE_H] = _FAST_BG.astype(np.uint8)
+    img[_FAST_TITLE_H:] = cells
+
+    title = Image.fromarray(img[:_FAST_TITLE_H])
+    ImageDraw.Draw(title).text(
+        (4, 1), f"Generation {generation}  "
+                f"({len(survivors)}/{len(world.creatures)} survived)",
+        fill="white")
+    img[:_FAST_TITLE_H] = np.asarray(title)
+    return img
+
+
+class SnapshotVideoWriter:
+    """
+    Streams render_world_frame images into a single video file (H.264 by
+    default) instead of writing one PNG per generation.  Requires PyAV.
+
+        with SnapshotVideoWriter("out/run.mp4") as video:
+            ...
+            video.write(world, gen, survivors, mode)
+    """
+
+    def __init__(self, path: str, fps: int = 10, codec: str = "libx264",
+                 scale: int = 4):
+        if av is None:
+            raise ImportError("SnapshotVideoWriter needs PyAV (pip install av)")
+        self.path      = path
+        self.scale     = scale
+        self.container = av.open(path, mode="w")
+        self.stream    = self.container.add_stream(codec, rate=fps)
+        self.stream.pix_fmt = "yuv420p"
+        self._sized    = False
+
+    def write(self, world, generation: int, survivors: list,
+              selection_mode: str):
+        img = render_world_frame(world, generation, survivors,
+                                 selection_mode, self.scale)
+        # yuv420p needs even dimensions: drop a trailing row / column
+        img = img[:img.shape[0] & ~1, :img.shape[1] & ~1]
+        if not self._sized:
+            self.stream.height, self.stream.width = img.shape[:2]
+            self._sized = True
+        frame = av.VideoFrame.from_ndarray(img, format="rgb24")
+        for packet in self.stream.encode(frame):
+            self.container.mux(packet)
+
+    def close(self):
+        """Flush the encoder and finalise the file."""
+        if self.container is None:
+            return
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+        self.container = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Evolution statistics chart
 # ──────────────────────────────────────────────────────────────────────────────
 
-def save_evolution_chart(stats: list, base: str = SAVE_DIR,
-                         filename: str = "evolution.png"):
+class StatsBuffer:
     """
-    Plot survivors, genetic diversity, and murders across all generations.
-    Mirrors the green/purple/orange chart from the video.
+    The per-generation stats the evolution chart plots, kept as growing
+    NumPy columns so a redraw slices views instead of re-listing the whole
+    history.  Drop-in for the plain list of stats dicts: ``append`` takes
+    the dict Simulation reports.
     """
-    if not stats:
-        return
-    gens      = [s["generation"]   for s in stats]
-    survivors = [s["survivors"]    for s in stats]
-    diversity = [s["diversity"]    for s in stats]
-    murdered  = [s["murdered"]     for s in stats]
-    popul     = [s["population"]   for s in stats]
+
+    FIELDS = ("generation", "survivors", "diversity", "murdered",
+              "population")
+
+    def __init__(self, capacity: int = 256):
+        self.n           = 0
+        self._cols       = {f: np.empty(capacity) for f in self.FIELDS}
+        # Running summaries, so a redraw needn't scan the columns
+        self.max_popul   = 0
+        self.any_murders = False
+
+    def append(self, stats: dict):
+        if self.n == len(self._cols["generation"]):       # grow ×2
+            for f, col in self._cols.items():
+                grown = np.empty(max(16, 2 * len(col)))
+                grown[:self.n] = col
+                self._cols[f] = grown
+        for f, col in self._cols.items():
+            col[self.n] = stats[f]
+        self.n += 1
+        self.max_popul   = max(self.max_popul, stats["population"])
+        self.any_murders = self.any_murders or stats["murdered"] > 0
+
+    def column(self, field: str) -> np.ndarray:
+        """View of `field` for the generations recorded so far."""
+        return self._cols[field][:self.n]
+
+    def __len__(self):
+        return self.n
+
+
+# The evolution chart's figure and line artists, built on first use
+_CHART_CACHE = {}
+
+
+def _chart_figure() -> dict:
+    """Return the cached evolution-chart figure, building it once."""
+    if _CHART_CACHE:
+        return _CHART_CACHE
 
     fig, ax1 = plt.subplots(figsize=(12, 5), dpi=100)
+    fig.subplots_adjust(left=0.06, right=0.94, top=0.92, bottom=0.11)
     fig.patch.set_facecolor("#111111")
     ax1.set_facecolor("#111111")
 
     # Survivors (green, left axis 0–population)
-    ax1.plot(gens, survivors, color="#44FF44", linewidth=1.2,
-             label="Survivors", zorder=3)
+    survivors, = ax1.plot([], [], color="#44FF44", linewidth=1.2,
+                          label="Survivors", zorder=3)
     ax1.set_ylabel("Count", color="white")
-    ax1.set_ylim(0, max(popul) * 1.05 if popul else 1)
     ax1.tick_params(axis="both", colors="white")
     ax1.set_xlabel("Generation", color="white")
 
@@ -141,13 +419,13 @@ def save_evolution_chart(stats: list, base: str = SAVE_DIR,
     ax2.set_facecolor("#111111")
 
     # Genetic diversity (purple, right axis 0–1)
-    ax2.plot(gens, diversity, color="#CC44FF", linewidth=1.0,
-             linestyle="--", label="Diversity", zorder=2)
+    diversity, = ax2.plot([], [], color="#CC44FF", linewidth=1.0,
+                          linestyle="--", label="Diversity", zorder=2)
 
-    # Murders (orange, also left axis but secondary)
-    if any(m > 0 for m in murdered):
-        ax1.plot(gens, murdered, color="#FF8800", linewidth=1.0,
-                 alpha=0.8, label="Murders", zorder=2)
+    # Murders (orange, also left axis but secondary) – shown only once
+    # there have been any
+    murders, = ax1.plot([], [], color="#FF8800", linewidth=1.0,
+                        alpha=0.8, label="Murders", zorder=2)
 
     ax2.set_ylabel("Genetic diversity (0–1)", color="white")
     ax2.set_ylim(0, 1.05)
@@ -156,19 +434,52 @@ def save_evolution_chart(stats: list, base: str = SAVE_DIR,
     for spine in ax1.spines.values():
         spine.set_edgecolor("#444444")
 
+    ax1.set_title("Evolutionary Progress", color="white", fontsize=12)
+
+    _CHART_CACHE.update(fig=fig, ax1=ax1, ax2=ax2, survivors=survivors,
+                        diversity=diversity, murders=murders)
+    return _CHART_CACHE
+
+
+def save_evolution_chart(stats, base: str = SAVE_DIR,
+                         filename: str = "evolution.png"):
+    """
+    Plot survivors, genetic diversity, and murders across all generations.
+    Mirrors the green/purple/orange chart from the video.
+    `stats` is a StatsBuffer (or a list of stats dicts, converted here).
+    """
+    if not stats:
+        return
+    if not isinstance(stats, StatsBuffer):
+        buf = StatsBuffer(len(stats))
+        for s in stats:
+            buf.append(s)
+        stats = buf
+    gens      = stats.column("generation")
+    survivors = stats.column("survivors")
+    diversity = stats.column("diversity")
+    murdered  = stats.column("murdered")
+
+    cached   = _chart_figure()
+    fig, ax1 = cached["fig"], cached["ax1"]
+
+    cached["survivors"].set_data(gens, survivors)
+    cached["diversity"].set_data(gens, diversity)
+    cached["murders"].set_data(gens, murdered)
+    cached["murders"].set_visible(stats.any_murders)
+    ax1.set_ylim(0, stats.max_popul * 1.05 or 1)
+    ax1.relim(visible_only=True)
+    ax1.autoscale_view(scaley=False)
+
     # Combined legend
-    lines1, labels1 = ax1.get_legend_handles_labels()
-    lines2, labels2 = ax2.get_legend_handles_labels()
-    ax1.legend(lines1 + lines2, labels1 + labels2,
+    lines = [line for line in (cached["survivors"], cached["murders"],
+                               cached["diversity"]) if line.get_visible()]
+    ax1.legend(lines, [line.get_label() for line in lines],
                facecolor="#222222", labelcolor="white",
                loc="lower right", fontsize=8)
 
-    ax1.set_title("Evolutionary Progress", color="white", fontsize=12)
-    plt.tight_layout()
     path = os.path.join(base, "charts", filename)
-    plt.savefig(path, dpi=100, bbox_inches="tight",
-                facecolor=fig.get_facecolor())
-    plt.close(fig)
+    _queue_png(fig, path)
     return path
 
 
@@ -197,52 +508,44 @@ def save_neural_diagram(creature, generation: int, label: str = "",
     active_actions   = sorted(set(
         c["sink_id"]   for c in connections if c["sink_type"]   == 1))
 
-    # Assign (x, y) positions for each node
+    # Assign (x, y) positions for each node: each column spreads its
+    # (sorted) ids evenly over (0, 1)
     node_pos = {}
-
-    def _y_positions(ids, n_total):
-        if not ids:
-            return {}
+    for kind, x, ids in (("S", 0.0, active_sensors),
+                         ("I", 0.5, active_internals),
+                         ("A", 1.0, active_actions)):
         step = 1.0 / (len(ids) + 1)
-        return {nid: (i + 1) * step for i, nid in enumerate(sorted(ids))}
-
-    for nid in active_sensors:
-        ys = list(range(len(active_sensors)))
-        idx = active_sensors.index(nid)
-        node_pos[("S", nid)] = (0.0, (idx + 1) / (len(active_sensors) + 1))
-
-    for nid in active_internals:
-        idx = active_internals.index(nid)
-        node_pos[("I", nid)] = (0.5, (idx + 1) / (len(active_internals) + 1))
-
-    for nid in active_actions:
-        idx = active_actions.index(nid)
-        node_pos[("A", nid)] = (1.0, (idx + 1) / (len(active_actions) + 1))
+        for i, nid in enumerate(ids):
+            node_pos[(kind, nid)] = (x, (i + 1) * step)
 
     fig, ax = plt.subplots(figsize=(10, 6), dpi=100)
     fig.patch.set_facecolor("#111111")
     ax.set_facecolor("#111111")
     ax.axis("off")
+    ax.set_position([0.0, 0.0, 1.0, 0.95])     # leave room for the title
     ax.set_xlim(-0.15, 1.35)
     ax.set_ylim(-0.05, 1.05)
 
-    # Draw edges
+    # Draw edges – all of them as one LineCollection, plus a second thin,
+    # opaque one over each edge's sink half to show its direction
+    edges = []
     for c in connections:
         src_key = ("S" if c["source_type"] == 0 else "I", c["source_id"])
         snk_key = ("I" if c["sink_type"]   == 0 else "A", c["sink_id"])
-        if src_key not in node_pos or snk_key not in node_pos:
-            continue
-        x1, y1 = node_pos[src_key]
-        x2, y2 = node_pos[snk_key]
-        w       = c["weight"]
-        color   = "#44FF44" if w >= 0 else "#FF4444"
-        lw      = 0.5 + min(3.0, abs(w) * 2)
-        ax.plot([x1, x2], [y1, y2], color=color, lw=lw, alpha=0.7, zorder=1)
-        # Arrowhead midpoint
-        mx, my = (x1 + x2) / 2, (y1 + y2) / 2
-        ax.annotate("", xy=(x2, y2), xytext=(mx, my),
-                    arrowprops=dict(arrowstyle="-|>", color=color, lw=0.8),
-                    zorder=2)
+        if src_key in node_pos and snk_key in node_pos:
+            edges.append((node_pos[src_key], node_pos[snk_key], c["weight"]))
+    if edges:
+        segs    = np.array([(p1, p2) for p1, p2, _ in edges], dtype=np.float32)
+        weights = np.array([w for _, _, w in edges])
+        colors  = np.where((weights >= 0)[:, None],
+                           to_rgb("#44FF44"), to_rgb("#FF4444"))
+        ax.add_collection(LineCollection(
+            segs, colors=colors, alpha=0.7, zorder=1,
+            linewidths=0.5 + np.minimum(3.0, np.abs(weights) * 2)))
+        heads       = segs.copy()
+        heads[:, 0] = segs.mean(axis=1)      # midpoint → sink
+        ax.add_collection(LineCollection(heads, colors=colors,
+                                         linewidths=0.8, zorder=2))
 
     # Draw nodes
     def _draw_nodes(keys, color, label_prefix, label_dict=None):
@@ -273,8 +576,7 @@ def save_neural_diagram(creature, generation: int, label: str = "",
         color="white", fontsize=10, pad=4)
 
     path = os.path.join(base, "neural", f"gen_{generation:06d}_{label}.png")
-    plt.savefig(path, dpi=100, bbox_inches="tight",
-                facecolor=fig.get_facecolor())
+    _queue_png(fig, path)
     plt.close(fig)
     return path
 
@@ -283,14 +585,32 @@ def save_neural_diagram(creature, generation: int, label: str = "",
 # CSV log
 # ──────────────────────────────────────────────────────────────────────────────
 
+# The log stays open for the whole run (reopened only if the path changes)
+# and is closed at interpreter exit; each row is flushed as it is written
+_CSV_STATE = {"path": None, "file": None, "writer": None}
+
+
+def _close_csv():
+    if _CSV_STATE["file"] is not None:
+        _CSV_STATE["file"].close()
+    _CSV_STATE.update(path=None, file=None, writer=None)
+
+
+atexit.register(_close_csv)
+
+
 def append_csv(stats: dict, base: str = SAVE_DIR):
     """Append one generation's stats to a CSV file."""
     if not LOG_CSV:
         return
     path = os.path.join(base, "evolution_log.csv")
-    file_exists = os.path.isfile(path)
-    with open(path, "a", newline="") as f:
+    if _CSV_STATE["path"] != path:
+        _close_csv()
+        file_exists = os.path.isfile(path)
+        f = open(path, "a", newline="")
         writer = csv.DictWriter(f, fieldnames=list(stats.keys()))
         if not file_exists:
             writer.writeheader()
-        writer.writerow(stats)
+        _CSV_STATE.update(path=path, file=f, writer=writer)
+    _CSV_STATE["writer"].writerow(stats)
+    _CSV_STATE["file"].flush()       # keep the log current for tail -f
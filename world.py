@@ -2,18 +2,34 @@
 World Grid for EvoSim.
 
 The world is a fixed-size 2-D grid. Each cell can hold at most one
-creature. The world also exposes helper methods that creatures use
-for sensing their environment.
+creature. The world also computes every creature's sensory inputs and
+carries out their actions, in batches over the SoA state.
 """
 
 import numpy as np
-from genome import genome_similarity
-from config import WORLD_WIDTH, WORLD_HEIGHT
+import config
+from genome import similarity_batch, genome_colors_batch, decode_genomes
+from neural_network import build_weight_batch
+from creature import (Creature, DIRS_DX, DIRS_DY, LEFT_TURN, RIGHT_TURN,
+                      REVERSE)
+from config import (WORLD_WIDTH, WORLD_HEIGHT, NUM_SENSORS, STEPS_PER_GEN,
+                    GENOME_SIZE, RADIO_MAX_DOSE, RADIO_FALLOFF)
+
+# Oscillator sensor: (sin + 1) / 2 with a 30-step period, tabulated once
+# and indexed by creature age
+OSC_PERIOD = 30
+OSC_TABLE  = ((np.sin(np.arange(OSC_PERIOD) * 2 * np.pi / OSC_PERIOD) + 1.0)
+              * 0.5).astype(np.float32)
 
 
 class World:
     """
     Manages the spatial grid and all creature movement.
+
+    Per-creature simulation state is stored structure-of-arrays style:
+    one NumPy array per field, indexed by creature slot (see
+    ``alloc_population``).  ``Creature`` objects are thin views onto a
+    row of these arrays.
     """
 
     def __init__(self, width: int = WORLD_WIDTH, height: int = WORLD_HEIGHT,
@@ -21,34 +37,102 @@ class World:
         self.width  = width
         self.height = height
         self.rng    = np.random.default_rng(seed)
-        # grid[y][x] = Creature or None
-        self._grid  = [[None] * width for _ in range(height)]
+        # Reciprocal sensor scale factors, so sense_all multiplies
+        # instead of dividing on every tick
+        self.inv_Wm1   = np.float32(1.0 / max(1, width - 1))
+        self.inv_Hm1   = np.float32(1.0 / max(1, height - 1))
+        self.inv_steps = np.float32(1.0 / max(1, STEPS_PER_GEN - 1))
+        self.inv_halfW = np.float32(2.0 / width)
+        self.inv_halfH = np.float32(2.0 / height)
+        self.inv_8     = np.float32(1.0 / 8.0)
+        self.inv_5     = np.float32(1.0 / 5.0)
+        # Radiation dose per step by column, with exponential falloff from
+        # the west wall (rad_west) or the east wall (rad_east)
+        self.rad_west = (np.exp(-RADIO_FALLOFF * np.arange(width)) * 0.01
+                         ).astype(np.float32)
+        self.rad_east = self.rad_west[::-1].copy()
+        # occupancy[y, x] = slot index of the creature there (−1 = empty);
+        # creature_slots maps the index back to its Creature
+        self.occupancy = np.full((height, width), -1, dtype=np.int32)
         self.creatures = []      # all living creatures this generation
         self.murder_count = 0    # reset each generation
+        self.alive_count  = 0    # living creatures, kept up to date on death
+        # This generation's decode_genomes output; Creature.brain builds
+        # from it on first access.  brain_epoch bumps with each generation
+        self.decoded     = None
+        self.brain_epoch = 0
+        self.alloc_population(0)
 
-    # ──────────────────────────────────────────────────────────────────────────
-    # Placement helpers
-    # ──────────────────────────────────────────────────────────────────────────
+    def alloc_population(self, n: int, genome_size: int = GENOME_SIZE):
+        """
+        Allocate the per-creature state arrays for `n` creature slots.
+        Every slot starts dead; ``populate`` brings placed creatures alive.
+        """
+        self.pos_x          = np.zeros(n, dtype=np.int16)
+        self.pos_y          = np.zeros(n, dtype=np.int16)
+        self.last_dir       = np.zeros(n, dtype=np.int16)   # index into DIRS
+        self.alive_mask     = np.zeros(n, dtype=np.bool_)
+        self.age            = np.zeros(n, dtype=np.int32)   # steps lived
+        self.radiation_dose = np.zeros(n, dtype=np.float32)
+        self.genomes        = np.zeros((n, genome_size), dtype=np.uint32)
+        self.colors         = np.zeros((n, 3), dtype=np.uint8)   # RGB
+        # Stacked (W_s, W_ii, W_ia) brain weights, see build_weight_batch
+        self.brain_weights  = build_weight_batch(decode_genomes(self.genomes))
+        self.creature_slots = []     # one Creature view per slot
+        # Scratch buffers reused every tick (sensor matrix, random draws)
+        self._sense_buf   = np.empty((n, NUM_SENSORS), dtype=np.float32)
+        self._rand_buf    = np.empty(n, dtype=np.float32)
+        self._randdir_buf = np.empty(n, dtype=np.float32)
+        # snapshot() output, filled in place each call
+        self._snap_xy     = np.empty((n, 2), dtype=np.int16)
+        self._snap_rgb    = np.empty((n, 3), dtype=np.uint8)
 
-    def place_creature(self, creature) -> bool:
-        """Put a creature at its (x,y) if the cell is free."""
-        if self._in_bounds(creature.x, creature.y):
-            if self._grid[creature.y][creature.x] is None:
-                self._grid[creature.y][creature.x] = creature
-                return True
-        return False
+    def reset_for_generation(self, genomes: np.ndarray) -> list:
+        """
+        Load a new generation's (N, G) genome matrix and place it on the
+        grid, reusing the state arrays and Creature objects from the last
+        generation when N and G are unchanged.  Returns the creatures that
+        were placed (all of them unless N exceeds the number of cells).
+        """
+        genomes = np.asarray(genomes, dtype=np.uint32)
+        n, genome_size = genomes.shape
+        reuse = (len(self.creature_slots) == n and
+                 self.genomes.shape[1] == genome_size)
+        if reuse:
+            self.pos_x.fill(0)
+            self.pos_y.fill(0)
+            self.last_dir.fill(0)
+            self.age.fill(0)
+            self.radiation_dose.fill(0.0)
+        else:
+            self.alloc_population(n, genome_size)
+
+        self.genomes[:] = genomes
+        self.colors[:]  = genome_colors_batch(genomes)
+
+        # Decode every gene of the generation in one pass.  The stacked
+        # weight tensors drive the batched forward pass; a Creature's own
+        # brain is only built (from its row of `decoded`) if something
+        # asks for it, e.g. the neural diagram
+        self.decoded       = decode_genomes(genomes)
+        self.brain_weights = build_weight_batch(self.decoded)
+        self.brain_epoch  += 1
+        if not reuse:
+            self.creature_slots = [Creature(self, i) for i in range(n)]
 
-    def remove_creature(self, creature):
-        """Remove creature from grid."""
-        if self._in_bounds(creature.x, creature.y):
-            if self._grid[creature.y][creature.x] is creature:
-                self._grid[creature.y][creature.x] = None
+        self.populate(self.creature_slots)
+        return self.creatures
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Placement
+    # ──────────────────────────────────────────────────────────────────────────
 
     def clear(self):
         """Remove all creatures from the grid."""
-        self._grid = [[None] * self.width for _ in range(self.height)]
+        self.occupancy.fill(-1)
         self.creatures = []
         self.murder_count = 0
+        self.alive_count  = 0
 
     def populate(self, creatures: list):
         """
@@ -56,106 +140,240 @@ class World:
         Assigns (x,y) positions before placement.
         """
         self.clear()
-        # Generate a shuffled list of all positions
-        positions = [(x, y)
-                     for y in range(self.height)
-                     for x in range(self.width)]
-        positions = [positions[i] for i in self.rng.permutation(len(positions))]
-        placed = 0
-        for creature in creatures:
-            if placed >= len(positions):
-                break
-            creature.x, creature.y = positions[placed]
-            self._grid[creature.y][creature.x] = creature
-            placed += 1
-        self.creatures = list(creatures[:placed])
+        self.alive_mask[:] = False
+        # Draw distinct random cells straight from the flat cell range
+        placed = creatures[:self.width * self.height]
+        cells  = self.rng.choice(self.width * self.height, size=len(placed),
+                                 replace=False)
+        idx    = np.array([c.idx for c in placed], dtype=np.intp)
+        ys, xs = np.divmod(cells, self.width)
+        self.pos_x[idx] = xs
+        self.pos_y[idx] = ys
+        self.occupancy.reshape(-1)[cells] = idx
+        self.alive_mask[idx] = True
+        self.creatures   = list(placed)      # overflow beyond W*H is dropped
+        self.alive_count = len(placed)
 
     # ──────────────────────────────────────────────────────────────────────────
     # Movement
     # ──────────────────────────────────────────────────────────────────────────
 
-    def move_creature(self, creature, dx: int, dy: int) -> bool:
-        """
-        Attempt to move creature by (dx, dy).
-        Returns True on success, False if blocked or OOB.
-        Movement is clamped at world boundaries (walls).
-        """
-        nx = max(0, min(self.width  - 1, creature.x + dx))
-        ny = max(0, min(self.height - 1, creature.y + dy))
-        if nx == creature.x and ny == creature.y:
-            return False     # wall block
-        if self._grid[ny][nx] is not None:
-            return False     # occupied
-        # Move
-        self._grid[creature.y][creature.x] = None
-        creature.x, creature.y = nx, ny
-        self._grid[ny][nx] = creature
-        # Update last direction
-        if dx != 0 or dy != 0:
-            from creature import DIRS
-            for i, (ddx, ddy) in enumerate(DIRS):
-                if ddx == (1 if dx > 0 else (-1 if dx < 0 else 0)) and \
-                   ddy == (1 if dy > 0 else (-1 if dy < 0 else 0)):
-                    creature.last_dir = i
-                    break
-        return True
+    def apply_actions(self, live: np.ndarray, best_act: np.ndarray,
+                      strength: np.ndarray):
+        """
+        Carry out every living creature's chosen action for this step at once.
+
+        Args:
+            live:     int array (M,), slot indices of the acting creatures
+            best_act: int array (M,), action index per creature (−1 = none)
+            strength: float array (M,), signed activation of that action
+
+        Moves are resolved simultaneously: a move succeeds if its target
+        cell is inside the world and was empty at the start of the move
+        phase.  When several creatures claim the same cell, a random one
+        of them wins and the rest stay put.
+        """
+        W, H = self.width, self.height
+        act  = best_act
+
+        # 4 / 5 / 6: turn left (−45°), turn right (+45°) or reverse –
+        # the heading changes even if the move that follows is blocked
+        for action_id, table in ((4, LEFT_TURN), (5, RIGHT_TURN), (6, REVERSE)):
+            turning = live[act == action_id]
+            self.last_dir[turning] = table[self.last_dir[turning]]
+
+        # 7: kill the creature directly ahead (noop unless enabled).  Kills
+        # land one at a time in a random order, and a killer struck down
+        # earlier in the same step no longer acts
+        if config.KILL_ENABLED:
+            killers = live[act == 7]            # fresh array: shuffle in place
+            self.rng.shuffle(killers)
+            for k in killers.tolist():
+                if not self.alive_mask[k]:
+                    continue
+                d = self.last_dir[k]
+                self.kill_creature_at(int(self.pos_x[k] + DIRS_DX[d]),
+                                      int(self.pos_y[k] + DIRS_DY[d]))
+            act = np.where(self.alive_mask[live], act, -1)
+
+        # Heading of the move each creature attempts (−1 = stays put)
+        move_dir = np.full(len(act), -1, dtype=np.intp)
+        sel = act == 0                      # move_x  (+ east / − west)
+        move_dir[sel] = np.where(strength[sel] > 0, 0, 4)
+        sel = act == 1                      # move_y  (+ north / − south)
+        move_dir[sel] = np.where(strength[sel] > 0, 2, 6)
+        sel = act == 2                      # move_random
+        rand_dirs = self.rng.random(out=self._randdir_buf[:len(act)],
+                                    dtype=np.float32)
+        rand_dirs *= 8.0                    # uniform in [0, 8)
+        # Generator.integers has no out=, hence the float draw; floor it to
+        # a heading 0..7 explicitly rather than via the int array's setitem
+        move_dir[sel] = rand_dirs[sel].astype(np.intp)
+        sel = (act >= 3) & (act <= 6)       # move_forward / after a turn
+        move_dir[sel] = self.last_dir[live[sel]]
+
+        # Work on flat cell ids (y * W + x) so each filter below is a single
+        # gather, and only the final winners are materialised
+        moving  = move_dir >= 0
+        movers  = live[moving]
+        heading = move_dir[moving]
+        x   = self.pos_x[movers].astype(np.intp)
+        y   = self.pos_y[movers].astype(np.intp)
+        src = y * W + x
+        dst = (np.clip(y + DIRS_DY[heading], 0, H - 1) * W +   # walls clamp
+               np.clip(x + DIRS_DX[heading], 0, W - 1))
+        occ  = self.occupancy.reshape(-1)                      # view
+        cand = np.flatnonzero((dst != src) & (occ[dst] < 0))
+
+        # Resolve contested cells: first claimant in a random order wins
+        # (cand is a fresh array, so it is shuffled in place)
+        self.rng.shuffle(cand)
+        _, first = np.unique(dst[cand], return_index=True)
+        win = cand[first]
+        movers, heading, src, dst = movers[win], heading[win], src[win], dst[win]
+
+        occ[src] = -1
+        occ[dst] = movers
+        self.pos_y[movers], self.pos_x[movers] = np.divmod(dst, W)
+        self.last_dir[movers] = heading
 
     def kill_creature_at(self, x: int, y: int):
         """Kill creature at grid cell (x,y) if present."""
-        if not self._in_bounds(x, y):
+        if not (0 <= x < self.width and 0 <= y < self.height):
             return
-        victim = self._grid[y][x]
-        if victim and victim.alive:
-            victim.alive = False
-            self._grid[y][x] = None
+        victim = self.occupancy[y, x]
+        if victim >= 0 and self.alive_mask[victim]:
+            self.alive_mask[victim] = False
+            self.occupancy[y, x] = -1
             self.murder_count += 1
+            self.alive_count  -= 1
+
+    def apply_radiation(self, west_active: bool):
+        """
+        Add one step of radiation dose to every living creature from the
+        active (west or east) wall; creatures whose accumulated dose
+        exceeds RADIO_MAX_DOSE die.
+        """
+        field = self.rad_west if west_active else self.rad_east
+        alive = self.alive_mask
+        np.add(self.radiation_dose, field[self.pos_x], out=self.radiation_dose,
+               where=alive)
+
+        dead = np.flatnonzero(alive & (self.radiation_dose > RADIO_MAX_DOSE))
+        if len(dead) == 0:
+            return
+        alive[dead] = False
+        self.alive_count -= len(dead)
+        self.occupancy[self.pos_y[dead], self.pos_x[dead]] = -1
 
     # ──────────────────────────────────────────────────────────────────────────
-    # Sensing helpers (used by creatures)
+    # Sensing
     # ──────────────────────────────────────────────────────────────────────────
 
-    def get_creature(self, x: int, y: int):
-        """Return creature at (x,y) or None."""
-        if self._in_bounds(x, y):
-            return self._grid[y][x]
-        return None
-
-    def local_density(self, cx: int, cy: int, radius: int = 2) -> int:
-        """Count living creatures within a square of given radius (excl. self)."""
-        count = 0
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = cx + dx, cy + dy
-                if self._in_bounds(nx, ny) and self._grid[ny][nx] is not None:
-                    count += 1
-        return count
-
-    def forward_density_gradient(self, cx: int, cy: int, dir_idx: int) -> float:
-        """
-        Measure population density in a cone of 5 cells ahead minus 5 behind.
-        Returns a value roughly in [−1, 1].
-        """
-        from creature import DIRS
-        dx, dy = DIRS[dir_idx]
-        fwd = sum(
-            1 for step in range(1, 6)
-            if self._in_bounds(cx + dx*step, cy + dy*step)
-            and self._grid[cy + dy*step][cx + dx*step] is not None
-        )
-        bwd = sum(
-            1 for step in range(1, 6)
-            if self._in_bounds(cx - dx*step, cy - dy*step)
-            and self._grid[cy - dy*step][cx - dx*step] is not None
-        )
-        return (fwd - bwd) / 5.0
-
-    def genetic_sim_to(self, creature, other) -> float:
-        """Genetic similarity between creature and other (0 if no other)."""
-        if other is None:
-            return 0.0
-        return genome_similarity(creature.genome, other.genome)
+    def sense_all(self, live: np.ndarray = None) -> np.ndarray:
+        """
+        Advance the given creatures' clocks by one step and compute all
+        their sensory inputs at once.
+
+        Args:
+            live: int array (M,) of slot indices to sense
+                  (default: every living creature)
+
+        Returns:
+            inputs: float32 array of shape (M, NUM_SENSORS), values 0..1,
+                    row i belonging to slot live[i].  This is a view of a
+                    scratch buffer that the next call overwrites.
+        """
+        if live is None:
+            live = np.flatnonzero(self.alive_mask)
+        W, H = self.width, self.height
+
+        self.age[live] += 1
+        age = self.age[live]
+
+        lx   = self.pos_x[live].astype(np.intp)
+        ly   = self.pos_y[live].astype(np.intp)
+        px   = lx.astype(np.float32)
+        py   = ly.astype(np.float32)
+        dx   = DIRS_DX[self.last_dir[live]]
+        dy   = DIRS_DY[self.last_dir[live]]
+        inputs = self._sense_buf[:len(live)]
+
+        inputs[:, 0]  = px * self.inv_Wm1                          # loc_x
+        inputs[:, 1]  = py * self.inv_Hm1                          # loc_y
+        inputs[:, 2]  = age * self.inv_steps                       # age
+        inputs[:, 3]  = self.rng.random(out=self._rand_buf[:len(live)],
+                                        dtype=np.float32)          # random
+        inputs[:, 4]  = OSC_TABLE[age % OSC_PERIOD]                # oscillator
+        inputs[:, 10] = (dx + 1) * 0.5                             # last move x
+        inputs[:, 11] = (dy + 1) * 0.5                             # last move y
+        inputs[:, 13] = 1.0                                        # constant
+
+        # 5 / 6: nearness to the EW / NS walls, 1 − min(d, far d) / half-size
+        for col, p, extent, inv_half in ((5, px, W, self.inv_halfW),
+                                         (6, py, H, self.inv_halfH)):
+            out = inputs[:, col]
+            np.subtract(extent - 1, p, out=out)
+            np.minimum(p, out, out=out)
+            out *= -inv_half
+            out += 1.0
+
+        # Neighbourhood sensors, against the slot-index grid
+        ldx  = dx.astype(np.intp)
+        ldy  = dy.astype(np.intp)
+        occ  = self.occupancy
+
+        # 7: local population density – 5x5 box sum via an integral image
+        out = inputs[:, 7]
+        np.multiply(self._box_count(occ >= 0, lx, ly, radius=2), self.inv_8,
+                    out=out)
+        np.minimum(out, 1.0, out=out)
+
+        # 8: population gradient – occupied cells 5 ahead minus 5 behind
+        steps = np.arange(1, 6)
+        fwd = self._count_occupied(occ, lx[:, None] + ldx[:, None] * steps,
+                                        ly[:, None] + ldy[:, None] * steps)
+        bwd = self._count_occupied(occ, lx[:, None] - ldx[:, None] * steps,
+                                        ly[:, None] - ldy[:, None] * steps)
+        inputs[:, 8] = (fwd - bwd) * self.inv_5
+
+        # 9 / 12: creature directly ahead
+        ax, ay = lx + ldx, ly + ldy
+        inb    = (ax >= 0) & (ax < W) & (ay >= 0) & (ay < H)
+        ahead  = np.where(inb, occ[np.clip(ay, 0, H - 1),
+                                   np.clip(ax, 0, W - 1)], -1)
+        has_ahead = ahead >= 0
+        inputs[:, 12] = has_ahead
+        inputs[:, 9]  = 0.0
+        inputs[has_ahead, 9] = similarity_batch(
+            self.genomes[live[has_ahead]], self.genomes[ahead[has_ahead]])
+
+        return inputs
+
+    @staticmethod
+    def _box_count(filled: np.ndarray, xs: np.ndarray, ys: np.ndarray,
+                   radius: int) -> np.ndarray:
+        """
+        For each (x, y), count filled cells within a square of the given
+        radius, excluding the centre cell (which is assumed filled).
+        """
+        H, W = filled.shape
+        S = np.zeros((H + 1, W + 1), dtype=np.int32)
+        S[1:, 1:] = filled.cumsum(axis=0).cumsum(axis=1)
+        x0 = np.clip(xs - radius, 0, W)
+        x1 = np.clip(xs + radius + 1, 0, W)
+        y0 = np.clip(ys - radius, 0, H)
+        y1 = np.clip(ys + radius + 1, 0, H)
+        return S[y1, x1] - S[y0, x1] - S[y1, x0] + S[y0, x0] - 1
+
+    @staticmethod
+    def _count_occupied(occ: np.ndarray, xs: np.ndarray,
+                        ys: np.ndarray) -> np.ndarray:
+        """Count occupied, in-bounds cells along the last axis of (xs, ys)."""
+        H, W = occ.shape
+        inb   = (xs >= 0) & (xs < W) & (ys >= 0) & (ys < H)
+        cells = occ[np.clip(ys, 0, H - 1), np.clip(xs, 0, W - 1)]
+        return ((cells >= 0) & inb).sum(axis=-1)
 
     # ──────────────────────────────────────────────────────────────────────────
     # Snapshot for visualisation
@@ -164,18 +382,14 @@ class World:
     def snapshot(self):
         """
         Returns two arrays for visualisation:
-          positions: list of (x, y) for every living creature
-          colors:    list of (r, g, b) tuples
+          positions: int array (N, 2) of (x, y) for every living creature
+          colors:    uint8 array (N, 3) of (r, g, b)
+        Both are views of buffers that the next call overwrites.
         """
-        positions = []
-        colors    = []
-        for c in self.creatures:
-            if c.alive:
-                positions.append((c.x, c.y))
-                colors.append(c.color)
-        return positions, colors
-
-    # ──────────────────────────────────────────────────────────────────────────
-
-    def _in_bounds(self, x: int, y: int) -> bool:
-        return 0 <= x < self.width and 0 <= y < self.height
+        alive = self.alive_mask
+        n     = int(np.count_nonzero(alive))
+        xy, rgb = self._snap_xy[:n], self._snap_rgb[:n]
+        np.compress(alive, self.pos_x, out=xy[:, 0])
+        np.compress(alive, self.pos_y, out=xy[:, 1])
+        np.compress(alive, self.colors, axis=0, out=rgb)
+        return xy, rgb